@@ -1,41 +1,185 @@
-import requests
+import httpx
 import json
 import csv
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import re
+import numpy as np
 import pandas as pd
-from isodate import parse_duration
+import xlsxwriter
 import time
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator
 import os
+import heapq
+import atexit
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+# httpx logs every request URL (including the API key) at INFO
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+# Supported channel URL formats, compiled once at import
+_URL_PATTERNS = (
+    (re.compile(r'youtube\.com/channel/([a-zA-Z0-9_-]+)'), 'channel'),
+    (re.compile(r'youtube\.com/c/([a-zA-Z0-9_-]+)'), 'custom'),
+    (re.compile(r'youtube\.com/user/([a-zA-Z0-9_-]+)'), 'user'),
+    (re.compile(r'youtube\.com/@([a-zA-Z0-9_.-]+)'), 'handle'),
+    (re.compile(r'youtube\.com/([a-zA-Z0-9_-]+)$'), 'custom')  # Direct channel name
+)
+
+# YouTube durations are ISO 8601 of the form P#DT#H#M#S (days only for 24h+ streams)
+_DURATION_PATTERN = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+_DURATION_UNIT_SECONDS = [86400, 3600, 60, 1]
+
+# Request usage is carried across runs so restarts don't reset the daily quota
+DEFAULT_QUOTA_FILE = os.path.join(os.path.expanduser('~'), '.ytscraper_quota.json')
+_QUOTA_SAVE_INTERVAL = 10  # Persist usage every N requests (and on exit)
+_QUOTA_FILE_LOCK = threading.Lock()  # Serializes read-merge-write of quota files in this process
+
+# Quota and server errors (and dropped connections) worth retrying, with exponential backoff
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+_MAX_RETRIES = 5
+_BACKOFF_FACTOR = 0.5
+_MAX_RETRY_AFTER = 30  # Cap on a server-requested wait, in seconds
+
+def _save_quota_at_exit(scraper_ref: weakref.ref):
+    """atexit hook that saves quota usage without keeping the scraper alive"""
+    scraper = scraper_ref()
+    if scraper is not None:
+        scraper._save_quota_state()
 
 class YouTubeChannelScraper:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, quota_file: Optional[str] = DEFAULT_QUOTA_FILE):
         
         self.api_key = api_key
         self.base_url = "https://www.googleapis.com/youtube/v3"
-        self.session = requests.Session()
-        self.request_count = 0
+        
+        # HTTP/2 multiplexes concurrent calls over a few keep-alive connections;
+        # the transport retries failed connects, _make_request retries resets and error statuses
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+        self.session = httpx.Client(transport=transport, timeout=30)
+        
         self.max_requests_per_day = 10000  # YouTube API quota limit
+        
+        # request_count is shared by worker threads; only touch it under the lock.
+        # Usage is merged into quota_file, so instances sharing a file add up; separate
+        # processes writing the same file at the same moment can still under-count.
+        # Set quota_file to None to keep usage in memory only.
+        self._lock = threading.Lock()
+        self.quota_file = quota_file
+        self._quota_date = datetime.now().date().isoformat()
+        self._unsaved_requests = 0  # Requests made since the last save
+        self.request_count = self._load_quota_state()
+        if self.quota_file:
+            atexit.register(_save_quota_at_exit, weakref.ref(self))
+        self.max_concurrent_requests = 5  # Parallel detail calls in flight at once
+        
+        # Memoize channel lookups per instance so re-scraping a channel costs no quota
+        self.resolve_channel_id = lru_cache(maxsize=256)(self.resolve_channel_id)
+        self.get_channel_info = lru_cache(maxsize=256)(self.get_channel_info)
+    
+    def clear_cache(self):
+        """Drop cached channel ID resolutions and channel info"""
+        self.resolve_channel_id.cache_clear()
+        self.get_channel_info.cache_clear()
+    
+    def _load_quota_state(self) -> int:
+        """Load today's request count from the quota file, treating a missing, stale or bad file as 0"""
+        if not self.quota_file or not os.path.exists(self.quota_file):
+            return 0
+        
+        try:
+            with open(self.quota_file, 'rb') as f:
+                state = _json_loads(f.read())
+            if not isinstance(state, dict) or state.get('date') != self._quota_date:
+                return 0
+            return int(state.get('count', 0))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not read quota file {self.quota_file}: {e}")
+            return 0
+    
+    def _save_quota_state(self):
+        """Add this instance's unsaved requests to today's count in the quota file"""
+        if not self.quota_file:
+            return
+        
+        with _QUOTA_FILE_LOCK, self._lock:
+            # Merge with the stored count so other instances' usage isn't overwritten
+            count = self._load_quota_state() + self._unsaved_requests
+            state = {'date': self._quota_date, 'count': count}
+            tmp_file = f"{self.quota_file}.tmp"
+            try:
+                # Write then rename so a crash never leaves a half-written file
+                with open(tmp_file, 'wb') as f:
+                    f.write(_json_dumps(state))
+                os.replace(tmp_file, self.quota_file)
+            except OSError as e:
+                logger.warning(f"Could not save quota file {self.quota_file}: {e}")
+                return
+            
+            self._unsaved_requests = 0
+            self.request_count = max(self.request_count, count)
     
     def _make_request(self, url: str, params: dict) -> dict:
         """
         Make API request with error handling and rate limiting
         """
-        if self.request_count >= self.max_requests_per_day:
-            raise Exception("Daily API quota exceeded")
+        with self._lock:
+            # The quota resets daily, so start counting again on a new day
+            today = datetime.now().date().isoformat()
+            if today != self._quota_date:
+                self._quota_date = today
+                self.request_count = 0
+                self._unsaved_requests = 0
+            
+            if self.request_count >= self.max_requests_per_day:
+                raise Exception("Daily API quota exceeded")
+            
+            # Reserve the slot under the same lock as the check so concurrent
+            # workers can't all pass it at max - 1
+            self.request_count += 1
+            self._unsaved_requests += 1
+            save_quota = self.request_count % _QUOTA_SAVE_INTERVAL == 0
         
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            for attempt in range(_MAX_RETRIES + 1):
+                try:
+                    response = self.session.get(url, params=params)
+                except httpx.TransportError as e:
+                    # Read timeouts and reset HTTP/2 streams are retried like error statuses
+                    if attempt == _MAX_RETRIES:
+                        raise
+                    logger.warning(f"Retrying after transport error: {e}")
+                    time.sleep(self._retry_delay(attempt))
+                    continue
+                
+                if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                    break
+                time.sleep(self._retry_delay(attempt, response))
             response.raise_for_status()
-            self.request_count += 1
             
-            data = response.json()
+            data = _json_loads(response.content)
             
             # Check for API errors
             if 'error' in data:
@@ -43,9 +187,25 @@ class YouTubeChannelScraper:
             
             return data
             
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
+            if isinstance(e, httpx.HTTPError):
+                # Failed requests don't count, so hand the reserved slot back
+                with self._lock:
+                    self.request_count = max(self.request_count - 1, 0)
+                    self._unsaved_requests -= 1
             logger.error(f"Request failed: {e}")
             raise Exception(f"Request failed: {e}")
+        
+        finally:
+            if save_quota:
+                self._save_quota_state()
+    
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait before retrying, honouring (a capped) Retry-After when YouTube sends it"""
+        retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+        if retry_after.isdigit():
+            return min(float(retry_after), _MAX_RETRY_AFTER)
+        return _BACKOFF_FACTOR * (2 ** attempt)
     
     def extract_channel_id(self, channel_url: str) -> str:
         """
@@ -55,16 +215,8 @@ class YouTubeChannelScraper:
         channel_url = channel_url.strip()
         
         # Handle different URL formats
-        patterns = [
-            (r'youtube\.com/channel/([a-zA-Z0-9_-]+)', 'channel'),
-            (r'youtube\.com/c/([a-zA-Z0-9_-]+)', 'custom'),
-            (r'youtube\.com/user/([a-zA-Z0-9_-]+)', 'user'),
-            (r'youtube\.com/@([a-zA-Z0-9_.-]+)', 'handle'),
-            (r'youtube\.com/([a-zA-Z0-9_-]+)$', 'custom')  # Direct channel name
-        ]
-        
-        for pattern, url_type in patterns:
-            match = re.search(pattern, channel_url)
+        for pattern, url_type in _URL_PATTERNS:
+            match = pattern.search(channel_url)
             if match:
                 channel_identifier = match.group(1)
                 
@@ -136,197 +288,256 @@ class YouTubeChannelScraper:
             raise ValueError("Channel not found")
         
         channel = data['items'][0]
+        snippet = channel['snippet']
+        stats = channel['statistics']
+        
+        description = snippet['description']
+        if len(description) > 500:
+            description = description[:500] + '...'
         
         return {
             'channel_id': channel_id,
-            'channel_name': channel['snippet']['title'],
-            'channel_description': channel['snippet']['description'][:500] + '...' if len(channel['snippet']['description']) > 500 else channel['snippet']['description'],
-            'subscriber_count': int(channel['statistics'].get('subscriberCount', 0)),
-            'video_count': int(channel['statistics'].get('videoCount', 0)),
-            'view_count': int(channel['statistics'].get('viewCount', 0)),
-            'channel_created_date': channel['snippet']['publishedAt'][:10],
-            'country': channel['snippet'].get('country', 'Unknown'),
-            'custom_url': channel['snippet'].get('customUrl', ''),
-            'thumbnail_url': channel['snippet']['thumbnails']['high']['url'],
+            'channel_name': snippet['title'],
+            'channel_description': description,
+            'subscriber_count': int(stats.get('subscriberCount', 0)),
+            'video_count': int(stats.get('videoCount', 0)),
+            'view_count': int(stats.get('viewCount', 0)),
+            'channel_created_date': snippet['publishedAt'][:10],
+            'country': snippet.get('country', 'Unknown'),
+            'custom_url': snippet.get('customUrl', ''),
+            'thumbnail_url': snippet['thumbnails']['high']['url'],
             'uploads_playlist_id': channel['contentDetails']['relatedPlaylists']['uploads']
         }
     
+    def iter_channel_videos(self, channel_url: str, max_results: int = 50) -> Iterator[dict]:
+        """
+        Yield videos from a YouTube channel as each detail batch arrives, newest first
+        """
+        channel_id = self.extract_channel_id(channel_url)
+        channel_info = self.get_channel_info(channel_id)
+        
+        logger.info(f"Scraping channel: {channel_info['channel_name']}")
+        logger.info(f"Channel has {channel_info['video_count']} total videos")
+        
+        uploads_playlist_id = channel_info['uploads_playlist_id']
+        
+        # Collect every video ID first, then fetch details in full batches
+        video_ids = self._get_playlist_video_ids(uploads_playlist_id, max_results)
+        yield from self.iter_video_details(video_ids, channel_info)
+    
     def get_channel_videos(self, channel_url: str, max_results: int = 50, sort_by: str = 'date') -> List[dict]:
         """
         Get videos from a YouTube channel with enhanced features
         """
         try:
-            channel_id = self.extract_channel_id(channel_url)
-            channel_info = self.get_channel_info(channel_id)
-            
-            logger.info(f"Scraping channel: {channel_info['channel_name']}")
-            logger.info(f"Channel has {channel_info['video_count']} total videos")
-            
-            uploads_playlist_id = channel_info['uploads_playlist_id']
+            videos = self.iter_channel_videos(channel_url, max_results)
             
-            # Get videos from uploads playlist
-            videos = []
-            next_page_token = None
-            
-            while len(videos) < max_results:
-                playlist_url = f"{self.base_url}/playlistItems"
-                playlist_params = {
-                    'part': 'snippet',
-                    'playlistId': uploads_playlist_id,
-                    'maxResults': min(50, max_results - len(videos)),
-                    'key': self.api_key
-                }
-                
-                if next_page_token:
-                    playlist_params['pageToken'] = next_page_token
-                
-                data = self._make_request(playlist_url, playlist_params)
-                
-                if 'items' not in data:
-                    break
-                
-                video_ids = [item['snippet']['resourceId']['videoId'] for item in data['items']]
-                
-                # Get detailed video statistics
-                video_details = self.get_video_details(video_ids, channel_info)
-                videos.extend(video_details)
-                
-                next_page_token = data.get('nextPageToken')
-                if not next_page_token:
-                    break
-                
-                logger.info(f"Scraped {len(videos)} videos so far...")
-                time.sleep(0.1)  # Rate limiting
+            # Sort videos if requested. Only max_results videos are fetched, so this is
+            # a full sort of what was scraped (top-K by views/likes among the newest uploads).
+            # 'date' keeps the playlist order, which is already newest first.
+            if sort_by in ('views', 'likes'):
+                videos = heapq.nlargest(max_results, videos, key=itemgetter(sort_by))
+            else:
+                videos = list(islice(videos, max_results))
             
-            # Sort videos if requested
-            if sort_by == 'views':
-                videos.sort(key=lambda x: x['views'], reverse=True)
-            elif sort_by == 'likes':
-                videos.sort(key=lambda x: x['likes'], reverse=True)
+            logger.info(f"Scraped {len(videos)} videos")
             
-            return videos[:max_results]
+            return videos
             
         except Exception as e:
             logger.error(f"Error: {e}")
             return []
     
-    def get_video_details(self, video_ids: List[str], channel_info: dict) -> List[dict]:
+    def scrape_channels(self, channel_urls: List[str], max_results: int = 50, sort_by: str = 'date',
+                        max_workers: int = 8) -> Dict[str, List[dict]]:
+        """
+        Scrape several channels concurrently, returning videos keyed by channel URL
+        """
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_channel_videos, channel_url, max_results, sort_by): channel_url
+                for channel_url in channel_urls
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Keep the caller's URL order rather than completion order
+        return {channel_url: results[channel_url] for channel_url in channel_urls}
+    
+    def _get_playlist_video_ids(self, playlist_id: str, max_results: int) -> List[str]:
+        """
+        Walk a playlist page by page and collect up to max_results video IDs
+        """
+        video_ids = []
+        next_page_token = None
+        
+        while len(video_ids) < max_results:
+            playlist_url = f"{self.base_url}/playlistItems"
+            playlist_params = {
+                'part': 'snippet',
+                'playlistId': playlist_id,
+                'maxResults': min(50, max_results - len(video_ids)),
+                'key': self.api_key
+            }
+            
+            if next_page_token:
+                playlist_params['pageToken'] = next_page_token
+            
+            data = self._make_request(playlist_url, playlist_params)
+            
+            if 'items' not in data:
+                break
+            
+            video_ids.extend(item['snippet']['resourceId']['videoId'] for item in data['items'])
+            
+            next_page_token = data.get('nextPageToken')
+            if not next_page_token:
+                break
+            
+            logger.info(f"Found {len(video_ids)} videos so far...")
+        
+        return video_ids
+    
+    def get_video_details(self, video_ids: List[str], channel_info: dict, batch_size: int = 50) -> List[dict]:
         """
         Get detailed information for a list of video IDs with enhanced metrics including thumbnails
         """
+        return list(self.iter_video_details(video_ids, channel_info, batch_size))
+    
+    def iter_video_details(self, video_ids: List[str], channel_info: dict, batch_size: int = 50) -> Iterator[dict]:
+        """
+        Yield detailed video information for a list of video IDs.
+        IDs are sent in batches of up to 50 (the videos.list limit) and batches run in parallel,
+        a window of max_concurrent_requests batches at a time so memory stays bounded.
+        """
         video_url = f"{self.base_url}/videos"
-        video_params = {
-            'part': 'snippet,statistics,contentDetails,status',
-            'id': ','.join(video_ids),
-            'key': self.api_key
-        }
-
-        data = self._make_request(video_url, video_params)
-
-        videos = []
-        for item in data.get('items', []):
-            try:
-                # Duration processing
-                duration_iso = item['contentDetails']['duration']
-                duration_seconds = parse_duration(duration_iso).total_seconds()
-                duration_minutes = round(duration_seconds / 60, 2)
-                
-                # Video type classification
-                video_type = self._classify_video_type(duration_minutes)
-                
-                # Statistics
-                views = int(item['statistics'].get('viewCount', 0))
-                likes = int(item['statistics'].get('likeCount', 0))
-                comments = int(item['statistics'].get('commentCount', 0))
-                
-                # Upload date processing
-                upload_date = item['snippet']['publishedAt']
-                upload_date_formatted = upload_date[:10]  # YYYY-MM-DD
-                days_since_upload = self._calculate_days_since_upload(upload_date)
-                
-                # Content analysis
-                title = item['snippet']['title']
-                description = item['snippet']['description']
-                
-                # Extract thumbnail URLs with multiple quality options
-                thumbnails = item['snippet'].get('thumbnails', {})
-                thumbnail_urls = self._extract_thumbnail_urls(thumbnails)
-                
-                video_info = {
-                    'title': title,
-                    'url': f"https://www.youtube.com/watch?v={item['id']}",
-                    'channel_name': channel_info['channel_name'],
-                    'views': views,
-                    'likes': likes,
-                    'comments': comments,
-                    'upload_date': upload_date_formatted,
-                    'upload_datetime': upload_date,
-                    'days_since_upload': days_since_upload,
-                    'duration_minutes': duration_minutes,
-                    'video_type': video_type,
-                    'description': description,
-                    'thumbnail_high': thumbnail_urls.get('high', ''),
-                    
-                }
-                
-                videos.append(video_info)
-                
-            except Exception as e:
-                logger.error(f"Error processing video {item.get('id', 'unknown')}: {e}")
-                continue
-
-        return videos
+        now_utc = datetime.now(timezone.utc)  # One reference time for every video
+        
+        def _flush_batch(ids: List[str]) -> List[dict]:
+            video_params = {
+                'part': 'snippet,statistics,contentDetails,status',
+                'id': ','.join(ids),
+                'key': self.api_key
+            }
+            return self._make_request(video_url, video_params).get('items', [])
+        
+        batch_size = min(batch_size, 50)
+        batches = [video_ids[i:i + batch_size] for i in range(0, len(video_ids), batch_size)]
+        
+        window = self.max_concurrent_requests
+        
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            for start in range(0, len(batches), window):
+                items = [item for batch in executor.map(_flush_batch, batches[start:start + window]) for item in batch]
+                yield from self._build_video_records(items, channel_info, now_utc)
     
-    def _extract_thumbnail_urls(self, thumbnails: dict) -> dict:
-
-        thumbnail_urls = {}
+    def _build_video_records(self, items: List[dict], channel_info: dict, now_utc: datetime) -> List[dict]:
+        """
+        Turn raw videos.list items into video records
+        """
+        if not items:
+            return []
         
-        # Define quality priorities (highest to lowest)
-        quality_priorities = ['high']
+        # Process all items column-wise instead of one video at a time
+        df = pd.json_normalize(items)
+        video_ids = self._text_column(df, 'id')
+        upload_dates = self._text_column(df, 'snippet.publishedAt')
+        # Explicit ISO 8601 format skips pandas' format inference; unreadable dates become NaT
+        upload_dts = pd.to_datetime(upload_dates, format='ISO8601', utc=True, errors='coerce')
         
-        # Extract all available thumbnail qualities
-        for quality in quality_priorities:
-            if quality in thumbnails:
-                thumbnail_urls[quality] = thumbnails[quality]['url']
-                break
+        # Skip (and log) videos without an ID or a readable upload date rather than failing the batch
+        invalid = (video_ids == '') | upload_dts.isna()
+        if invalid.any():
+            for video_id in video_ids[invalid]:
+                logger.error(f"Error processing video {video_id or 'unknown'}: missing ID or invalid upload date")
+            valid = ~invalid
+            df = df[valid].reset_index(drop=True)
+            video_ids = video_ids[valid].reset_index(drop=True)
+            upload_dates = upload_dates[valid].reset_index(drop=True)
+            upload_dts = upload_dts[valid].reset_index(drop=True)
+            if df.empty:
+                return []
         
-       # Set the best available thumbnail (highest quality)
-        for quality in quality_priorities:
-            if quality in thumbnail_urls:
-                thumbnail_urls['high'] = thumbnail_urls[quality]
-                break
+        # Duration processing
+        duration_seconds = self._parse_durations(self._text_column(df, 'contentDetails.duration'))
+        duration_minutes = (duration_seconds / 60).round(2)
         
-        return thumbnail_urls
+        videos = pd.DataFrame({
+            'title': self._text_column(df, 'snippet.title'),
+            'url': 'https://www.youtube.com/watch?v=' + video_ids,
+            'channel_name': channel_info['channel_name'],
+            'views': self._count_column(df, 'statistics.viewCount'),
+            'likes': self._count_column(df, 'statistics.likeCount'),
+            'comments': self._count_column(df, 'statistics.commentCount'),
+            'upload_date': upload_dates.str[:10],  # YYYY-MM-DD
+            'upload_datetime': upload_dates,
+            'days_since_upload': self._calculate_days_since_upload(upload_dts, now_utc),
+            'duration_minutes': duration_minutes,
+            'video_type': self._classify_video_type(duration_minutes),
+            'description': self._text_column(df, 'snippet.description'),
+            'thumbnail_high': self._text_column(df, 'snippet.thumbnails.high.url'),  # Blank when YouTube returns none
+        })
+
+        return videos.to_dict('records')
     
-    def _classify_video_type(self, duration_minutes: float) -> str:
+    def _parse_durations(self, durations: pd.Series) -> pd.Series:
+        """Convert ISO 8601 durations to seconds, treating unparseable values as 0"""
+        parts = durations.str.extract(_DURATION_PATTERN).astype(float).fillna(0)
+        return parts @ _DURATION_UNIT_SECONDS
+    
+    def _text_column(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """String column, treating missing values as blank"""
+        if column not in df:
+            return pd.Series('', index=df.index, dtype=object)
+        return df[column].fillna('').astype(str)
+    
+    def _count_column(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """Integer statistic column, treating hidden or missing counts as 0"""
+        if column not in df:
+            return pd.Series(0, index=df.index)
+        return pd.to_numeric(df[column], errors='coerce').fillna(0).astype(int)
+    
+    def _classify_video_type(self, duration_minutes: pd.Series) -> pd.Series:
         """Classify video type based on duration in minutes"""
-        if duration_minutes <= 10:
-            return 'Low'
-        elif duration_minutes <= 30:
-            return 'Medium'
-        else:
-            return 'Long'
+        return pd.cut(
+            duration_minutes,
+            bins=[-np.inf, 10, 30, np.inf],
+            labels=['Low', 'Medium', 'Long']
+        ).astype(str)
     
-    def _calculate_days_since_upload(self, upload_date: str) -> int:
-        """Calculate days since upload"""
-        upload_dt = datetime.fromisoformat(upload_date.replace('Z', '+00:00'))
-        now = datetime.now(upload_dt.tzinfo)
-        return (now - upload_dt).days
+    def _calculate_days_since_upload(self, upload_dts: pd.Series, now_utc: datetime) -> pd.Series:
+        """Calculate days since upload from parsed UTC upload times"""
+        return (pd.Timestamp(now_utc) - upload_dts).dt.days
     
-    def save_to_excel(self, videos: List[dict], filename: str = 'youtube_data.xlsx'):
-        """Save data to Excel with multiple sheets and formatting"""
-        if not videos:
+    def save_to_excel(self, videos: Iterable[dict], filename: str = 'youtube_data.xlsx'):
+        """Save data to Excel, flushing each row to disk as it is written.
+        Accepts a list or a stream such as iter_channel_videos()"""
+        videos = iter(videos)
+        first_video = next(videos, None)
+        if first_video is None:
             logger.warning("No videos to save")
             return
 
-        # Create Excel writer
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        columns = list(first_video.keys())
+        
+        # constant_memory keeps only the current row in RAM; rows must be written in order
+        workbook = xlsxwriter.Workbook(filename, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False
+        })
+        try:
             # Main data sheet
-            df = pd.DataFrame(videos)
-            df.to_excel(writer, sheet_name='Video Data', index=False)
+            worksheet = workbook.add_worksheet('Video Data')
+            header_format = workbook.add_format({'bold': True, 'border': 1})
+            worksheet.write_row(0, 0, columns, header_format)
             
-            # Create a separate sheet for thumbnail URLs for better readability
-           
+            for row, video in enumerate(chain([first_video], videos), start=1):
+                worksheet.write_row(row, 0, [video.get(column) for column in columns])
+        finally:
+            workbook.close()
             
         logger.info(f"Data saved to {filename}")
     
@@ -347,12 +558,16 @@ if __name__ == "__main__":
     print("=" * 50)
     
     # Get user input
-    channel_url = input("Enter YouTube channel URL: ").strip()
-    max_videos = int(input("Enter maximum number of videos to scrape (default 50): ") or "50")
+    channel_urls = [url.strip() for url in input("Enter YouTube channel URL(s), comma separated: ").split(',') if url.strip()]
+    max_videos = int(input("Enter maximum number of videos to scrape per channel (default 50): ") or "50")
     
     
     # Scrape videos
-    videos = scraper.get_channel_videos(channel_url, max_results=max_videos)
+    if len(channel_urls) == 1:
+        videos = scraper.get_channel_videos(channel_urls[0], max_results=max_videos)
+    else:
+        results = scraper.scrape_channels(channel_urls, max_results=max_videos)
+        videos = [video for channel_videos in results.values() for video in channel_videos]
     
     if videos:
         # Display results